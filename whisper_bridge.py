@@ -8,15 +8,63 @@ Supports both standard Whisper and Distil-Whisper models via faster-whisper
 import sys
 import json
 import os
-import argparse
+import io
+import base64
+import struct
 from pathlib import Path
+from types import SimpleNamespace
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import bisect
 import threading
 import time
 import gc
+import atexit
+import faulthandler
+import contextlib
+import stat
+import selectors
+
+# Prefer orjson for the hot JSON paths (server protocol, progress lines) when installed
+try:
+    import orjson
+
+    def json_dumpb(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def json_dumps(obj):
+        return json_dumpb(obj).decode()
+
+    json_loads = orjson.loads  # Raises orjson.JSONDecodeError, a json.JSONDecodeError subclass
+except ImportError:
+    def json_dumpb(obj):
+        return json.dumps(obj).encode()
+
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+# Optional: length-prefixed msgpack framing for the server protocol (--proto msgpack)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def error_result(message):
+    """Build a failed result; always a fresh dict, since the server stamps request_id into replies"""
+    return {"error": message, "success": False}
 
 # Auto-detect and preload cuDNN libraries from pip packages
 def preload_cudnn_libraries():
     """Preload cuDNN libraries from pip packages before CTranslate2 loads"""
+    # Nothing to preload when CUDA is hidden or the NVIDIA driver isn't present
+    if os.environ.get("CUDA_VISIBLE_DEVICES") == "":
+        return False
+    # dlopen also finds the driver under WSL2, which has no /proc/driver/nvidia
+    if load_cuda_driver() is None:
+        return False
+
     import ctypes
     try:
         import site
@@ -38,26 +86,25 @@ def preload_cudnn_libraries():
             "libcudnn_heuristic.so.9",
         ]
 
-        # Track loaded paths to prevent double-loading from different locations
-        loaded_paths = set()
+        # Load from the first site-packages that has cuDNN to avoid double-loading
+        cudnn_lib_dir = next(
+            (d for d in (os.path.join(sp, "nvidia", "cudnn", "lib") for sp in site_packages if sp) if os.path.isdir(d)),
+            None
+        )
+        if cudnn_lib_dir is None:
+            return False
+
         loaded_names = []
-        for sp in site_packages:
-            if not sp:
+        for lib_name in lib_names:
+            lib_path = os.path.join(cudnn_lib_dir, lib_name)
+            if not os.path.exists(lib_path):
                 continue
-            cudnn_lib_dir = os.path.join(sp, "nvidia", "cudnn", "lib")
-            if os.path.isdir(cudnn_lib_dir):
-                for lib_name in lib_names:
-                    lib_path = os.path.join(cudnn_lib_dir, lib_name)
-                    # Resolve to real path to handle symlinks
-                    real_path = os.path.realpath(lib_path)
-                    if os.path.exists(lib_path) and real_path not in loaded_paths:
-                        try:
-                            # Use RTLD_LOCAL instead of RTLD_GLOBAL to avoid symbol conflicts
-                            ctypes.CDLL(lib_path, mode=ctypes.RTLD_LOCAL)
-                            loaded_paths.add(real_path)
-                            loaded_names.append(lib_name)
-                        except OSError as e:
-                            print(f"[whisper_bridge] Warning: Could not load {lib_name}: {e}", file=sys.stderr)
+            try:
+                # Use RTLD_LOCAL instead of RTLD_GLOBAL to avoid symbol conflicts
+                ctypes.CDLL(lib_path, mode=ctypes.RTLD_LOCAL)
+                loaded_names.append(lib_name)
+            except OSError as e:
+                print(f"[whisper_bridge] Warning: Could not load {lib_name}: {e}", file=sys.stderr)
 
         if loaded_names:
             print(f"[whisper_bridge] Preloaded cuDNN libraries: {loaded_names}", file=sys.stderr)
@@ -71,7 +118,8 @@ def preload_cudnn_libraries():
         print(f"[whisper_bridge] Warning: Could not preload cuDNN (OS error): {e}", file=sys.stderr)
         return False
 
-_cudnn_preloaded = preload_cudnn_libraries()
+# Result of preload_cudnn_libraries; None until a mode that loads models asks for it
+_cudnn_preloaded = None
 
 # Model definitions - standard Whisper and Distil-Whisper
 # For standard models (tiny, base, small, medium, large-v3, turbo),
@@ -144,81 +192,70 @@ WHISPER_MODELS = {
     },
 }
 
+# Resolved FFmpeg path ("" when not found), populated once by get_ffmpeg_path
+_FFMPEG_PATH = None
+FFMPEG_EXE = "ffmpeg.exe" if sys.platform == "win32" else "ffmpeg"
+
+# Files faster-whisper needs from a model repo (mirrors faster_whisper.utils.download_model)
+MODEL_FILE_PATTERNS = [
+    "config.json",
+    "preprocessor_config.json",
+    "model.bin",
+    "tokenizer.json",
+    "vocabulary.*",
+]
 
-def get_ffmpeg_path():
-    """Get path to bundled FFmpeg executable with proper production support"""
-    # Check environment variables first
-    env_paths = [
-        ("FFMPEG_PATH", os.environ.get("FFMPEG_PATH")),
-        ("FFMPEG_EXECUTABLE", os.environ.get("FFMPEG_EXECUTABLE")),
-        ("FFMPEG_BINARY", os.environ.get("FFMPEG_BINARY"))
-    ]
 
-    for env_name, env_path in env_paths:
-        if env_path and os.path.exists(env_path) and os.access(env_path, os.X_OK):
-            return env_path
+def _is_executable_file(path):
+    return os.path.isfile(path) and os.access(path, os.X_OK)
 
+
+def _find_ffmpeg_path():
+    """Locate an FFmpeg executable without spawning any processes"""
     # Determine base path
     if getattr(sys, 'frozen', False):
         base_path = sys._MEIPASS
     else:
         base_path = os.path.dirname(os.path.abspath(__file__))
-
-    # Try multiple possible paths for production Electron app
-    possible_paths = []
-
-    if sys.platform == "darwin":  # macOS
-        possible_paths = [
-            # Unpacked ASAR locations
-            os.path.join(base_path, "..", "..", "..", "app.asar.unpacked", "node_modules", "ffmpeg-static", "ffmpeg"),
-            os.path.join(base_path, "..", "app.asar.unpacked", "node_modules", "ffmpeg-static", "ffmpeg"),
-            # Development path
-            os.path.join(base_path, "node_modules", "ffmpeg-static", "ffmpeg"),
-            # Alternative development path
-            os.path.join(base_path, "..", "node_modules", "ffmpeg-static", "ffmpeg"),
-        ]
-    elif sys.platform == "win32":  # Windows
-        possible_paths = [
-            os.path.join(base_path, "..", "..", "..", "app.asar.unpacked", "node_modules", "ffmpeg-static", "ffmpeg.exe"),
-            os.path.join(base_path, "..", "app.asar.unpacked", "node_modules", "ffmpeg-static", "ffmpeg.exe"),
-            os.path.join(base_path, "node_modules", "ffmpeg-static", "ffmpeg.exe"),
-            os.path.join(base_path, "..", "node_modules", "ffmpeg-static", "ffmpeg.exe"),
-        ]
-    else:  # Linux
-        possible_paths = [
-            os.path.join(base_path, "..", "..", "..", "app.asar.unpacked", "node_modules", "ffmpeg-static", "ffmpeg"),
-            os.path.join(base_path, "..", "app.asar.unpacked", "node_modules", "ffmpeg-static", "ffmpeg"),
-            os.path.join(base_path, "node_modules", "ffmpeg-static", "ffmpeg"),
-            os.path.join(base_path, "..", "node_modules", "ffmpeg-static", "ffmpeg"),
-        ]
-
-    # Try each possible path
-    for ffmpeg_path in possible_paths:
-        abs_path = os.path.abspath(ffmpeg_path)
-        if os.path.exists(abs_path) and os.access(abs_path, os.X_OK):
-            return abs_path
-
-    # Try system FFmpeg as last resort
+    ffmpeg_static = os.path.join("node_modules", "ffmpeg-static", FFMPEG_EXE)
+    unpacked = os.path.join("app.asar.unpacked", ffmpeg_static)
+
+    candidates = [
+        # Check environment variables first
+        os.environ.get("FFMPEG_PATH"),
+        os.environ.get("FFMPEG_EXECUTABLE"),
+        os.environ.get("FFMPEG_BINARY"),
+        # Unpacked ASAR locations for the production Electron app
+        os.path.join(base_path, "..", "..", "..", unpacked),
+        os.path.join(base_path, "..", unpacked),
+        # Development paths
+        os.path.join(base_path, ffmpeg_static),
+        os.path.join(base_path, "..", ffmpeg_static),
+    ]
     if sys.platform == "darwin":
-        common_ffmpeg_paths = [
+        # System FFmpeg - GUI apps on macOS don't inherit the shell PATH
+        candidates += [
             "/opt/homebrew/bin/ffmpeg",  # Homebrew on Apple Silicon
             "/usr/local/bin/ffmpeg",      # Homebrew on Intel or manual installs
             "/usr/bin/ffmpeg",            # System location
-            "ffmpeg"                      # In PATH
         ]
-    else:
-        common_ffmpeg_paths = ["ffmpeg"]
 
-    for ffmpeg_cmd in common_ffmpeg_paths:
-        try:
-            import subprocess
-            result = subprocess.run([ffmpeg_cmd, "-version"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                return ffmpeg_cmd
-        except Exception:
-            continue
+    # dict.fromkeys drops duplicate env var entries while keeping priority order
+    for candidate in dict.fromkeys(candidates):
+        if candidate and _is_executable_file(candidate):
+            return os.path.abspath(candidate)
 
-    return None
+    # Fall back to PATH lookup - an executable found there needs no -version probe
+    import shutil
+    return shutil.which(FFMPEG_EXE)
+
+
+def get_ffmpeg_path():
+    """Get path to bundled FFmpeg executable with proper production support (resolved once)"""
+    global _FFMPEG_PATH
+    if _FFMPEG_PATH is None:
+        _FFMPEG_PATH = _find_ffmpeg_path() or ""
+    return _FFMPEG_PATH or None
 
 
 # Set FFmpeg path
@@ -262,50 +299,196 @@ if ffmpeg_path:
                 pass  # Symlink creation failed, ffmpeg may still work via PATH
 
 
-# Global model cache to avoid reloading
-_model_cache = {}
+# Weight precisions selectable with --precision and their CTranslate2 compute types
+# (int8 depends on the device, see get_compute_type)
+PRECISION_COMPUTE_TYPES = {"fp16": "float16", "bf16": "bfloat16", "int8": "int8"}
+PRECISION_CHOICES = ["auto", *PRECISION_COMPUTE_TYPES]
+
+# Global LRU model cache keyed by (model_name, device, compute_type) to avoid reloading
+_model_cache = OrderedDict()
+_model_cache_lock = threading.Lock()
 _device = None
+_precision = "auto"  # Set by set_precision; "auto" picks the compute type from the device
+_gpu_info = None
+
+# Cache keys whose load went through an exception path; the traceback may have left
+# reference cycles, so releasing them warrants a full gc.collect()
+_gc_on_release = set()
+
+# Decoded waveforms keyed by (path, mtime_ns, size), evicted LRU-first past get_wave_cache_bytes()
+_wave_cache = OrderedDict()
+_wave_cache_bytes = 0
+_wave_cache_lock = threading.Lock()
+
+# Memoized model sizes: cache_path -> (snapshots dir mtime, total bytes)
+_size_cache = {}
+
+# Serializes stdout writes between the server's reader and worker threads
+_stdout_lock = threading.Lock()
+
+# msgpack frames are prefixed with their body length as a little-endian uint32
+_FRAME_HEADER = struct.Struct("<I")
+
+# Binary stdout used for msgpack frames; None while the server speaks line-JSON
+_msgpack_stdout = None
 
 
 def check_cudnn_available():
-    """Check if cuDNN is available for GPU inference"""
-    # Use the result from preloading attempt
+    """Check if cuDNN is available for GPU inference, preloading it on first use
+
+    Must first run before faster-whisper (CTranslate2) is imported; main() calls it up front
+    for the modes that load models, so list/check/delete never touch the CUDA libraries.
+    """
+    global _cudnn_preloaded
+    if _cudnn_preloaded is None:
+        _cudnn_preloaded = preload_cudnn_libraries()
     return _cudnn_preloaded
 
 
+def load_cuda_driver():
+    """Load the NVIDIA driver library without initializing a CUDA runtime, or return None"""
+    import ctypes
+    lib_name = "nvcuda.dll" if sys.platform == "win32" else "libcuda.so.1"
+    try:
+        return ctypes.CDLL(lib_name)
+    except OSError:
+        return None
+
+
+def get_gpu_info():
+    """Get (name, (major, minor) compute capability) of the first CUDA device, or None"""
+    global _gpu_info
+    if _gpu_info is not None:
+        return _gpu_info or None
+
+    import ctypes
+    _gpu_info = ()
+    cuda = load_cuda_driver()
+    if cuda is None:
+        return None
+
+    try:
+        count = ctypes.c_int(0)
+        if cuda.cuInit(0) != 0 or cuda.cuDeviceGetCount(ctypes.byref(count)) != 0 or count.value < 1:
+            return None
+
+        name = ctypes.create_string_buffer(256)
+        if cuda.cuDeviceGetName(name, len(name), 0) != 0:
+            name.value = b"unknown GPU"
+
+        # CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MAJOR / _MINOR
+        major, minor = ctypes.c_int(0), ctypes.c_int(0)
+        cuda.cuDeviceGetAttribute(ctypes.byref(major), 75, 0)
+        cuda.cuDeviceGetAttribute(ctypes.byref(minor), 76, 0)
+
+        _gpu_info = (name.value.decode(errors="replace"), (major.value, minor.value))
+    except AttributeError:
+        return None
+
+    return _gpu_info
+
+
+def get_gpu_memory_info():
+    """Get (free, total) bytes of the first CUDA device through the driver API, or None"""
+    import ctypes
+    cuda = load_cuda_driver()
+    if cuda is None:
+        return None
+
+    try:
+        device = ctypes.c_int(0)
+        context = ctypes.c_void_p()
+        free, total = ctypes.c_size_t(0), ctypes.c_size_t(0)
+        if cuda.cuInit(0) != 0 or cuda.cuDeviceGet(ctypes.byref(device), 0) != 0:
+            return None
+
+        # Borrow the primary context that the CUDA runtime (and so CTranslate2) already uses
+        if cuda.cuDevicePrimaryCtxRetain(ctypes.byref(context), device) != 0:
+            return None
+        try:
+            if cuda.cuCtxPushCurrent_v2(context) != 0:
+                return None
+            try:
+                if cuda.cuMemGetInfo_v2(ctypes.byref(free), ctypes.byref(total)) != 0:
+                    return None
+            finally:
+                cuda.cuCtxPopCurrent_v2(ctypes.byref(ctypes.c_void_p()))
+        finally:
+            cuda.cuDevicePrimaryCtxRelease_v2(device)
+    except AttributeError:
+        return None
+
+    return free.value, total.value
+
+
 def get_device():
     """Detect and return the best available device (CUDA > CPU)"""
     global _device
     if _device is not None:
         return _device
 
-    try:
-        import torch
-        if torch.cuda.is_available():
-            gpu_name = torch.cuda.get_device_name(0)
-            if check_cudnn_available():
-                _device = "cuda"
-                print(f"[whisper_bridge] Using GPU: {gpu_name}", file=sys.stderr)
-            else:
-                _device = "cpu"
-                print(f"[whisper_bridge] GPU detected ({gpu_name}) but cuDNN not found, using CPU", file=sys.stderr)
-                print("[whisper_bridge] Install cuDNN for GPU acceleration: pip install nvidia-cudnn-cu12", file=sys.stderr)
+    # Probe cuDNN and the driver directly - importing torch here costs seconds and hundreds of MB
+    if not check_cudnn_available():
+        _device = "cpu"
+        if load_cuda_driver() is not None:
+            print("[whisper_bridge] GPU detected but cuDNN not found, using CPU", file=sys.stderr)
+            print("[whisper_bridge] Install cuDNN for GPU acceleration: pip install nvidia-cudnn-cu12", file=sys.stderr)
         else:
-            _device = "cpu"
             print("[whisper_bridge] CUDA not available, using CPU", file=sys.stderr)
-    except ImportError:
+        return _device
+
+    gpu_info = get_gpu_info()
+    if gpu_info:
+        gpu_name, (major, minor) = gpu_info
+        _device = "cuda"
+        print(f"[whisper_bridge] Using GPU: {gpu_name} (compute capability {major}.{minor}, "
+              f"compute type {get_compute_type()})", file=sys.stderr)
+    else:
         _device = "cpu"
-        print("[whisper_bridge] PyTorch not found, using CPU", file=sys.stderr)
+        print("[whisper_bridge] CUDA not available, using CPU", file=sys.stderr)
 
     return _device
 
 
+def set_precision(precision):
+    """Select the weight precision for models loaded from now on ("auto", "fp16", "bf16" or "int8")"""
+    global _precision
+    if precision not in PRECISION_CHOICES:
+        raise ValueError(f"Unsupported precision: {precision}")
+    _precision = precision
+
+
 def get_compute_type():
-    """Get the appropriate compute type based on device"""
-    device = get_device()
-    if device == "cuda":
+    """Get the appropriate compute type based on device
+
+    A precision chosen with set_precision (--precision or the server's "precision" field)
+    maps onto a CTranslate2 compute type: fp16 -> float16, bf16 -> bfloat16, and int8 ->
+    int8_float16 on CUDA or int8 on CPU. int8 roughly halves weight memory and speeds up
+    decoding at the cost of a small accuracy loss; bf16 needs an Ampere or newer GPU.
+
+    Otherwise OPENWHISPR_COMPUTE_TYPE overrides the choice. On CUDA the type follows the compute
+    capability: int8_float16 from 7.5 (Turing tensor cores), float16 from 7.0, and "auto"
+    below that, since older GPUs silently upcast float16 to float32. CPU uses "auto", which
+    lets CTranslate2 pick the fastest type the hardware supports.
+    """
+    if _precision == "int8":
+        return "int8_float16" if get_device() == "cuda" else "int8"
+    if _precision != "auto":
+        return PRECISION_COMPUTE_TYPES[_precision]
+
+    override = os.environ.get("OPENWHISPR_COMPUTE_TYPE")
+    if override:
+        return override
+
+    if get_device() != "cuda":
+        return "auto"
+
+    capability = get_gpu_info()[1]
+    if capability >= (7, 5):
+        return "int8_float16"  # Roughly half the VRAM of float16
+    if capability >= (7, 0):
         return "float16"
-    return "int8"  # Use int8 for CPU for better performance
+    return "auto"
 
 
 def get_cache_dir():
@@ -313,189 +496,482 @@ def get_cache_dir():
     return os.path.expanduser("~/.cache/huggingface/hub")
 
 
-def get_model_cache_path(model_name):
-    """Get the expected cache path for a model"""
+def _repo_id_for(hf_id):
+    """Map a WHISPER_MODELS hf_id to the HuggingFace repo it is downloaded from"""
+    # Built-in models (tiny, base, etc.) vs explicit HuggingFace repos
+    if "/" in hf_id:
+        return hf_id
+
+    # Built-in faster-whisper model names map to the same repos faster-whisper uses
+    # e.g., "base" -> "Systran/faster-whisper-base"
+    if hf_id == "turbo":
+        return "mobiuslabsgmbh/faster-whisper-large-v3-turbo"
+    return f"Systran/faster-whisper-{hf_id}"
+
+
+def _cache_name_for(hf_id):
+    """Map a WHISPER_MODELS hf_id to its HuggingFace cache directory name"""
+    # HuggingFace cache layout: models--{org}--{repo}
+    return f"models--{_repo_id_for(hf_id).replace('/', '--')}"
+
+
+def get_model_repo_id(model_name):
+    """Get the HuggingFace repo ID a model is downloaded from"""
     if model_name not in WHISPER_MODELS:
         return None
+    return _repo_id_for(WHISPER_MODELS[model_name]["hf_id"])
 
-    model_info = WHISPER_MODELS[model_name]
-    hf_id = model_info["hf_id"]
 
-    # Built-in models (tiny, base, etc.) vs explicit HuggingFace repos
-    if "/" in hf_id:
-        # Explicit HuggingFace repo: models--{org}--{repo}
-        cache_name = f"models--{hf_id.replace('/', '--')}"
-    else:
-        # Built-in faster-whisper model names map to Systran repos
-        # e.g., "base" -> "Systran/faster-whisper-base"
-        if hf_id == "turbo":
-            cache_name = "models--Systran--faster-whisper-large-v3-turbo"
-        elif hf_id == "large-v3":
-            cache_name = "models--Systran--faster-whisper-large-v3"
-        else:
-            cache_name = f"models--Systran--faster-whisper-{hf_id}"
+def get_model_cache_path(model_name):
+    """Get the expected cache path for a model"""
+    if model_name not in WHISPER_MODELS:
+        return None
 
     cache_dir = get_cache_dir()
-    return os.path.join(cache_dir, cache_name)
+    return os.path.join(cache_dir, _cache_name_for(WHISPER_MODELS[model_name]["hf_id"]))
 
 
 def is_model_downloaded(model_name):
     """Check if a model is already downloaded"""
     cache_path = get_model_cache_path(model_name)
-    if cache_path and os.path.exists(cache_path):
-        # Check for snapshots directory which indicates complete download
-        snapshots_dir = os.path.join(cache_path, "snapshots")
-        if os.path.exists(snapshots_dir) and os.listdir(snapshots_dir):
-            return True
-    return False
+    if not cache_path:
+        return False
+
+    # A non-empty snapshots directory indicates a complete download
+    try:
+        with os.scandir(os.path.join(cache_path, "snapshots")) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+
+def _iter_file_sizes(path):
+    """Yield the size of every regular file under path, reusing scandir's cached stat data"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Snapshot symlinks point into blobs/, which is already counted
+            if entry.is_file(follow_symlinks=False):
+                yield entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                yield from _iter_file_sizes(entry.path)
 
 
 def get_model_size_on_disk(model_name):
     """Get the actual size of a downloaded model on disk"""
     cache_path = get_model_cache_path(model_name)
-    if not cache_path or not os.path.exists(cache_path):
+    if not cache_path:
         return 0
 
-    total_size = 0
-    for dirpath, _, filenames in os.walk(cache_path):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            if os.path.isfile(fp):
-                total_size += os.path.getsize(fp)
+    # Reuse the last walk until the snapshots directory changes
+    try:
+        snapshots_mtime = os.stat(os.path.join(cache_path, "snapshots")).st_mtime
+    except OSError:
+        snapshots_mtime = None
+
+    cached = _size_cache.get(cache_path)
+    if cached is not None and snapshots_mtime is not None and cached[0] == snapshots_mtime:
+        return cached[1]
+
+    if not os.path.exists(cache_path):
+        return 0
+
+    total_size = sum(_iter_file_sizes(cache_path))
 
+    if snapshots_mtime is not None:
+        _size_cache[cache_path] = (snapshots_mtime, total_size)
     return total_size
 
 
-def load_model(model_name="base"):
-    """Load Whisper/Distil-Whisper model with caching for performance"""
-    global _model_cache
+def invalidate_model_size(model_name):
+    """Forget the memoized on-disk size of a model after it changes"""
+    _size_cache.pop(get_model_cache_path(model_name), None)
 
-    from faster_whisper import WhisperModel
 
-    # Return cached model if available
-    if model_name in _model_cache:
-        return _model_cache[model_name]
+def get_max_cached_models():
+    """Get how many models may stay loaded at once (OPENWHISPR_MODEL_CACHE overrides)
 
+    On CUDA a second model only stays loaded while it fits; make_room_for_model evicts
+    earlier when device memory runs short.
+    """
     try:
-        device = get_device()
-        compute_type = get_compute_type()
+        return max(1, int(os.environ["OPENWHISPR_MODEL_CACHE"]))
+    except (KeyError, ValueError):
+        return 2
 
-        # Get HuggingFace model ID
-        if model_name in WHISPER_MODELS:
-            hf_id = WHISPER_MODELS[model_name]["hf_id"]
-        else:
-            # Fallback: try using the model name directly (for custom models)
-            hf_id = model_name
 
-        print(f"[whisper_bridge] Loading model '{model_name}' ({hf_id}) on {device} with {compute_type}", file=sys.stderr)
+def empty_cuda_cache(threshold=0.8):
+    """Release cached CUDA allocator blocks if PyTorch is using CUDA and memory is tight
 
-        model = WhisperModel(
-            hf_id,
-            device=device,
-            compute_type=compute_type,
-            download_root=None  # Uses default HuggingFace cache
-        )
+    CTranslate2 never allocates through PyTorch, so PyTorch is never imported and its CUDA
+    state never initialized just for this: only blocks it already cached can be freed.
+    Emptying the cache stalls the device and forces fresh allocations on the next load,
+    so it only runs once PyTorch holds more than `threshold` of the device's memory.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_initialized():
+        total = torch.cuda.get_device_properties(0).total_memory
+        if torch.cuda.memory_reserved() > threshold * total:
+            torch.cuda.empty_cache()
+            torch.cuda.ipc_collect()
+            return True
+    return False
 
-        # Limit cache size
-        if len(_model_cache) >= 2:
-            oldest_key = next(iter(_model_cache))
-            del _model_cache[oldest_key]
-            gc.collect()
 
-        _model_cache[model_name] = model
-        return model
+def _model_cache_key(model_name):
+    """Cache key a model loads under with the current device and precision"""
+    return (model_name, get_device(), get_compute_type())
 
-    except (RuntimeError, ValueError, FileNotFoundError, OSError) as e:
-        print(f"[whisper_bridge] Error loading model: {e}", file=sys.stderr)
-        return None
-    except ImportError as e:
-        print(f"[whisper_bridge] Missing dependency for model: {e}", file=sys.stderr)
-        return None
 
+def _describe_cache_key(cache_key):
+    """Name a cache entry for logs, e.g. 'small' (int8 on cpu)"""
+    model_name, device, compute_type = cache_key
+    return f"'{model_name}' ({compute_type} on {device})"
 
-def monitor_download_progress(model_name, expected_size, stop_event):
-    """Monitor download progress by watching cache directory size"""
-    cache_path = get_model_cache_path(model_name)
-    if not cache_path:
+
+def unload_model(model_name, compute_type=None):
+    """Remove cached instances of a model, at every precision unless compute_type is given
+
+    Returns True if one was loaded.
+    """
+    with _model_cache_lock:
+        keys = [key for key in _model_cache
+                if key[0] == model_name and compute_type in (None, key[2])]
+    return _release_models(keys)
+
+
+def get_cached_model(model_name):
+    """Return the loaded instance of a model for the current device, or None if it isn't cached"""
+    cache_key = _model_cache_key(model_name)
+    with _model_cache_lock:
+        model = _model_cache.get(cache_key)
+        if model is not None:
+            _model_cache.move_to_end(cache_key)
+    return model
+
+
+def can_load_alongside(model_name):
+    """Check whether a model fits in device memory next to the ones already loaded
+
+    Host memory is assumed to suffice on CPU. On CUDA the on-disk size with 50% headroom
+    for activations must fit in the free memory; unknown sizes never count as fitting.
+    """
+    if get_device() != "cuda":
+        return True
+
+    memory = get_gpu_memory_info()
+    size = get_model_size_on_disk(model_name) if model_name in WHISPER_MODELS else 0
+    return memory is not None and size > 0 and size * 1.5 < memory[0]
+
+
+def make_room_for_model(model_name):
+    """Evict least recently used models ahead of loading one that isn't cached yet
+
+    Models are evicted until the cache has a free slot and the new model fits in device
+    memory next to the rest, so two models never overlap in VRAM they don't fit in.
+    Models that can stay loaded do, so switching back to them needs no reload.
+    """
+    # The same model at another precision is a separate entry that needs room too
+    cache_key = _model_cache_key(model_name)
+    max_cached = get_max_cached_models()
+    while True:
+        with _model_cache_lock:
+            if cache_key in _model_cache or not _model_cache:
+                return
+            lru_key = next(iter(_model_cache))
+            full = len(_model_cache) >= max_cached
+        if not full and can_load_alongside(model_name):
+            return
+        _release_models([lru_key])
+
+
+def _collect_cycles(suspected):
+    """Run a full gc.collect() only when a released model may still be pinned by a cycle
+
+    Refcounting frees models on their last del, so a full-heap walk is only worth it for
+    suspected cycles or when the oldest generation is due for a collection anyway.
+    """
+    if suspected or gc.get_count()[2] >= gc.get_threshold()[2]:
+        gc.collect()
+
+
+def _release_models(cache_keys):
+    """Evict models from the cache, returning True if any was loaded
+
+    Entries are popped under _model_cache_lock; garbage collection and trimming the CUDA
+    cache happen after it is released, so loads and transcriptions never wait on them.
+    Callers must drop their own references to the models first so that they are freed.
+    """
+    with _model_cache_lock:
+        released = [(key, key in _gc_on_release, _model_cache.pop(key))
+                    for key in cache_keys if key in _model_cache]
+        _gc_on_release.difference_update(cache_keys)
+
+    released_any = bool(released)
+    on_cuda = False
+    while released:
+        cache_key, failed_load, model = released.pop()
+        print(f"[whisper_bridge] Evicting model {_describe_cache_key(cache_key)} from cache",
+              file=sys.stderr)
+        # Refcounting frees the model's buffers on del; only a reference held beyond this
+        # local (and getrefcount's argument) hints at a cycle worth a full collection
+        needs_gc = sys.getrefcount(model) > 2 or failed_load
+        del model
+        # CTranslate2 frees host memory on deletion; only CUDA has an allocator cache to trim
+        if cache_key[1] == "cuda":
+            on_cuda = True
+            _collect_cycles(needs_gc)
+
+    if on_cuda and empty_cuda_cache():
+        print("[whisper_bridge] GPU memory cleared", file=sys.stderr)
+    if released_any:
+        sys.stderr.flush()  # Eviction may run on a background thread, away from any reply
+    return released_any
+
+
+def prefetch_model_files(model_name, model_path=None):
+    """Ask the OS to start reading a model's weight files into the page cache"""
+    if not hasattr(os, "posix_fadvise"):
         return
 
-    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    if model_path:
+        snapshot_dirs = [model_path]
+    else:
+        cache_path = get_model_cache_path(model_name)
+        if not cache_path:
+            return
+        try:
+            with os.scandir(os.path.join(cache_path, "snapshots")) as entries:
+                snapshot_dirs = [entry.path for entry in entries if entry.is_dir()]
+        except OSError:
+            return
 
-    last_size = 0
-    last_update_time = time.time()
-    start_time = time.time()
-    speed_samples = []
-    last_progress_update = 0
+    for snapshot_dir in snapshot_dirs:
+        try:
+            with os.scandir(snapshot_dir) as entries:
+                weight_files = [entry.path for entry in entries
+                                if entry.name.endswith((".bin", ".safetensors"))]
+        except OSError:
+            continue
 
-    # Maximum monitoring time (30 minutes) to prevent infinite loops
-    MAX_MONITOR_TIME = 30 * 60
+        for weight_file in weight_files:
+            try:
+                fd = os.open(weight_file, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
 
-    while not stop_event.is_set():
-        # Safety timeout to prevent infinite monitoring
-        if time.time() - start_time > MAX_MONITOR_TIME:
-            print(f"[whisper_bridge] Download monitoring timed out after {MAX_MONITOR_TIME}s", file=sys.stderr)
-            break
+
+def warmup_model(model):
+    """Run one second of silence through the model so kernel selection and buffer
+    allocation happen before the first real request
+
+    The encoder always sees a fixed 30 second mel window, so a single pass leaves
+    CTranslate2's caching allocator holding the buffers every later request reuses.
+    The options mirror the short-clip dictation path in transcribe_audio; the language
+    is fixed because detecting one on silence only adds time.
+    """
+    import numpy as np
+
+    segments, _ = model.transcribe(
+        np.zeros(16000, dtype=np.float32),
+        language="en",
+        beam_size=1,
+        best_of=1,
+        temperature=0.0,
+        condition_on_previous_text=False,
+        without_timestamps=True,
+    )
+    for _ in segments:  # Segments are generated lazily
+        pass
+
+
+def evict_lru_models():
+    """Drop least recently used models beyond the cache limit and release their memory"""
+    with _model_cache_lock:
+        excess = len(_model_cache) - get_max_cached_models()
+        evicted_keys = list(itertools.islice(_model_cache, max(0, excess)))
+    _release_models(evicted_keys)
+
+
+def load_model(model_name="base", model_path=None, warmup=False, evict=True):
+    """Load Whisper/Distil-Whisper model with caching for performance
+
+    Args:
+        model_name: Whisper model name
+        model_path: Local snapshot directory to load from instead of resolving the model ID
+        warmup: Run a dummy transcription after loading (for long-lived server processes)
+        evict: Evict models beyond the cache limit right away; pass False to call
+            evict_lru_models() later, off the latency-critical path
+    """
+    from faster_whisper import WhisperModel
+
+    device = get_device()
+    compute_type = get_compute_type()
+    cache_key = (model_name, device, compute_type)
+
+    # Loads are serialized so a model is never loaded twice concurrently
+    with _model_cache_lock:
+        # Return cached model if available
+        if cache_key in _model_cache:
+            _model_cache.move_to_end(cache_key)
+            return _model_cache[cache_key]
+
+        load_failed_once = False
+        try:
+            # Get HuggingFace model ID
+            if model_name in WHISPER_MODELS:
+                hf_id = WHISPER_MODELS[model_name]["hf_id"]
+            else:
+                # Fallback: try using the model name directly (for custom models)
+                hf_id = model_name
+
+            auto_note = " (lets CTranslate2 pick the fastest supported type)" if compute_type == "auto" else ""
+            print(f"[whisper_bridge] Loading model '{model_name}' ({hf_id}) on {device} with {compute_type}"
+                  f"{auto_note}", file=sys.stderr, flush=True)
+
+            # Start readahead of the weights while CTranslate2 parses the config and tokenizer
+            prefetch_model_files(model_name, model_path)
+
+            try:
+                model = WhisperModel(
+                    model_path or hf_id,
+                    device=device,
+                    compute_type=compute_type,
+                    download_root=None  # Uses default HuggingFace cache
+                )
+            except ValueError as e:
+                # CTranslate2 rejects compute types the device can't run efficiently
+                if compute_type == "auto":
+                    raise
+                print(f"[whisper_bridge] {compute_type} not supported on {device} ({e}), falling back to auto", file=sys.stderr)
+                load_failed_once = True
+                model = WhisperModel(
+                    model_path or hf_id,
+                    device=device,
+                    compute_type="auto",
+                    download_root=None
+                )
+
+            if warmup:
+                try:
+                    warmup_model(model)
+                except Exception as e:
+                    print(f"[whisper_bridge] Warning: Model warmup failed: {e}", file=sys.stderr)
+                    load_failed_once = True
+
+            _model_cache[cache_key] = model
+            if load_failed_once:
+                _gc_on_release.add(cache_key)
+
+        except (RuntimeError, ValueError, FileNotFoundError, OSError) as e:
+            print(f"[whisper_bridge] Error loading model: {e}", file=sys.stderr)
+            return None
+        except ImportError as e:
+            print(f"[whisper_bridge] Missing dependency for model: {e}", file=sys.stderr)
+            return None
+
+    if evict:
+        evict_lru_models()
+    return model
+
+
+def start_model_preload(model_name):
+    """Load a model on a background thread, returning an event set once loading finishes"""
+    preload_done = threading.Event()
+
+    def preload():
         try:
-            current_size = 0
-            if os.path.exists(cache_path):
-                for dirpath, _, filenames in os.walk(cache_path):
-                    for f in filenames:
-                        fp = os.path.join(dirpath, f)
-                        if os.path.isfile(fp):
-                            current_size += os.path.getsize(fp)
+            # CTranslate2 creates the CUDA context as part of the load
+            load_model(model_name, warmup=True)
+        finally:
+            sys.stderr.flush()
+            preload_done.set()
+
+    threading.Thread(target=preload, daemon=True).start()
+    return preload_done
+
 
-            current_time = time.time()
-            time_diff = current_time - last_update_time
+def make_download_progress_class(model_name, expected_bytes):
+    """Build a tqdm class that reports HuggingFace download callbacks as PROGRESS lines
+
+    Recent huggingface_hub releases aggregate per-file bytes into bars built from tqdm_class;
+    older ones only pass it the "Fetching N files" bar, so progress then advances per file.
+    """
+    from huggingface_hub.utils import tqdm as hf_tqdm
+
+    byte_bar_seen = False
+
+    class DownloadProgress(hf_tqdm):
+        def __init__(self, *args, **kwargs):
+            nonlocal byte_bar_seen
+            # snapshot_download opens its byte bars before the file-count bar; of the byte
+            # bars only the bytes-written one carries an exact total
+            is_byte_bar = kwargs.get("unit") == "B"
+            byte_bar_seen = byte_bar_seen or is_byte_bar
+            self._tracks_bytes = is_byte_bar and kwargs.get("desc") != "Downloading bytes"
+            self._tracks_files = not byte_bar_seen
+            kwargs["disable"] = True
+            super().__init__(*args, **kwargs)
+            self._last_n = self.n
+            self._last_update_time = time.monotonic()
+            self._speed_samples = deque(maxlen=10)
+            self._speed_sum = 0.0
+
+        def update(self, n=1):
+            if not (self._tracks_bytes or self._tracks_files) or not n:
+                return
+
+            with self.get_lock():
+                self.n += n
+                current_time = time.monotonic()
+                time_diff = current_time - self._last_update_time
+                if self._tracks_bytes:
+                    total_bytes = self.total or expected_bytes
+                    downloaded = self.n
+                else:
+                    # Without byte callbacks, estimate from the share of files fetched
+                    total_bytes = expected_bytes
+                    downloaded = int(expected_bytes * self.n / self.total) if self.total else 0
 
-            speed_mbps = 0
-            if last_size > 0 and time_diff > 0 and current_size > last_size:
-                bytes_per_second = (current_size - last_size) / time_diff
-                speed_mbps = (bytes_per_second * 8) / (1024 * 1024)
+                # Throttle to the same ~2 updates per second the UI expects
+                if time_diff < 0.5 and downloaded < total_bytes:
+                    return
 
-                speed_samples.append(speed_mbps)
-                if len(speed_samples) > 10:
-                    speed_samples.pop(0)
-                speed_mbps = sum(speed_samples) / len(speed_samples)
+                speed_mbps = 0
+                if time_diff > 0 and downloaded > self._last_n:
+                    bytes_per_second = (downloaded - self._last_n) / time_diff
+                    speed_mbps = (bytes_per_second * 8) / (1024 * 1024)
 
-            expected_bytes = expected_size * 1024 * 1024  # Convert MB to bytes
-            percentage = min((current_size / expected_bytes * 100) if expected_bytes > 0 else 0, 100)
+                    # Rolling mean of the last 10 samples, kept as a running sum
+                    if len(self._speed_samples) == self._speed_samples.maxlen:
+                        self._speed_sum -= self._speed_samples[0]
+                    self._speed_samples.append(speed_mbps)
+                    self._speed_sum += speed_mbps
+                    speed_mbps = self._speed_sum / len(self._speed_samples)
 
-            if (current_time - last_progress_update > 0.5 or
-                abs(percentage - last_progress_update) > 1.0):
+                percentage = min((downloaded / total_bytes * 100) if total_bytes > 0 else 0, 100)
 
                 progress_data = {
                     "type": "progress",
                     "model": model_name,
-                    "downloaded_bytes": current_size,
-                    "total_bytes": expected_bytes,
+                    "downloaded_bytes": downloaded,
+                    "total_bytes": total_bytes,
                     "percentage": round(percentage, 1),
                     "speed_mbps": round(speed_mbps, 2) if speed_mbps > 0 else 0
                 }
+                sys.stderr.write(f"PROGRESS:{json_dumps(progress_data)}\n")
 
-                print(f"PROGRESS:{json.dumps(progress_data)}", file=sys.stderr)
-                last_progress_update = percentage
+                self._last_n = downloaded
+                self._last_update_time = current_time
 
-            if percentage >= 95:
-                break
-
-            if current_size == last_size and current_time - last_update_time > 10:
-                if percentage > 90:
-                    break
-
-            last_size = current_size
-            last_update_time = current_time
-
-        except Exception:
-            pass
-
-        time.sleep(0.5)
+    return DownloadProgress
 
 
 def download_model(model_name="base"):
-    """Download Whisper/Distil-Whisper model with real-time progress monitoring"""
-    stop_event = threading.Event()
-    progress_thread = None
-
+    """Download Whisper/Distil-Whisper model with real-time progress reporting"""
     try:
         # Check if model is already downloaded
         if is_model_downloaded(model_name):
@@ -513,44 +989,35 @@ def download_model(model_name="base"):
             return {
                 "model": model_name,
                 "downloaded": False,
-                "error": f"Unknown model: {model_name}",
-                "success": False
+                **error_result(f"Unknown model: {model_name}")
             }
 
         # Get expected file size
         expected_size = WHISPER_MODELS[model_name]["size_mb"]
+        expected_bytes = expected_size * 1024 * 1024
 
-        # Start progress monitoring in background thread
-        progress_thread = threading.Thread(
-            target=monitor_download_progress,
-            args=(model_name, expected_size, stop_event),
-            daemon=True
+        # Download the model files; huggingface_hub reports each chunk to the progress class
+        from huggingface_hub import snapshot_download
+        model_path = snapshot_download(
+            repo_id=get_model_repo_id(model_name),
+            cache_dir=get_cache_dir(),
+            allow_patterns=MODEL_FILE_PATTERNS,
+            tqdm_class=make_download_progress_class(model_name, expected_bytes),
         )
-        progress_thread.start()
-
-        # Start the actual download by loading the model
-        model = load_model(model_name)
 
-        # Stop progress monitoring
-        stop_event.set()
-
-        # Wait for progress thread to finish (give it 5 seconds to clean up)
-        if progress_thread and progress_thread.is_alive():
-            progress_thread.join(timeout=5)
-            if progress_thread.is_alive():
-                print("[whisper_bridge] Warning: Progress monitor thread did not exit cleanly", file=sys.stderr)
+        # Load from the downloaded snapshot to verify it is usable
+        model = load_model(model_name, model_path=model_path)
 
         if model is None:
             return {
                 "model": model_name,
                 "downloaded": False,
-                "error": "Failed to download model",
-                "success": False
+                **error_result("Failed to download model")
             }
 
         # Get final file info
+        invalidate_model_size(model_name)
         final_size = get_model_size_on_disk(model_name)
-        expected_bytes = expected_size * 1024 * 1024
 
         # Send completion signal
         completion_data = {
@@ -560,7 +1027,7 @@ def download_model(model_name="base"):
             "total_bytes": expected_bytes,
             "percentage": 100
         }
-        print(f"PROGRESS:{json.dumps(completion_data)}", file=sys.stderr)
+        sys.stderr.write(f"PROGRESS:{json_dumps(completion_data)}\n")
 
         return {
             "model": model_name,
@@ -572,20 +1039,16 @@ def download_model(model_name="base"):
         }
 
     except KeyboardInterrupt:
-        stop_event.set()
         return {
             "model": model_name,
             "downloaded": False,
-            "error": "Download interrupted by user",
-            "success": False
+            **error_result("Download interrupted by user")
         }
     except Exception as e:
-        stop_event.set()
         return {
             "model": model_name,
             "downloaded": False,
-            "error": str(e),
-            "success": False
+            **error_result(str(e))
         }
 
 
@@ -595,8 +1058,7 @@ def check_model_status(model_name="base"):
         if model_name not in WHISPER_MODELS:
             return {
                 "model": model_name,
-                "error": f"Unknown model: {model_name}",
-                "success": False
+                **error_result(f"Unknown model: {model_name}")
             }
 
         if is_model_downloaded(model_name):
@@ -618,17 +1080,28 @@ def check_model_status(model_name="base"):
     except Exception as e:
         return {
             "model": model_name,
-            "error": str(e),
-            "success": False
+            **error_result(str(e))
         }
 
 
 def list_models():
     """List all available models and their download status"""
+    cache_dir = get_cache_dir()
+
+    # Read the cache root once; only models with a cache directory need disk checks
+    try:
+        with os.scandir(cache_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        present = set()
+
     model_info = []
 
     for model_name, info in WHISPER_MODELS.items():
-        status = check_model_status(model_name)
+        if _cache_name_for(info["hf_id"]) in present:
+            status = check_model_status(model_name)
+        else:
+            status = {"model": model_name, "downloaded": False, "success": True}
         status["family"] = info["family"]
         status["description"] = info["description"]
         status["expected_size_mb"] = info["size_mb"]
@@ -636,11 +1109,23 @@ def list_models():
 
     return {
         "models": model_info,
-        "cache_dir": get_cache_dir(),
+        "cache_dir": cache_dir,
         "success": True
     }
 
 
+def remove_tree_in_background(paths):
+    """Delete directories from a detached process so the caller can exit immediately"""
+    import subprocess
+    subprocess.Popen(
+        [sys.executable, "-c", "import shutil, sys\nfor p in sys.argv[1:]: shutil.rmtree(p, ignore_errors=True)", *paths],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
 def delete_model(model_name="base"):
     """Delete a downloaded model"""
     try:
@@ -649,12 +1134,24 @@ def delete_model(model_name="base"):
         if cache_path and os.path.exists(cache_path):
             import shutil
             file_size = get_model_size_on_disk(model_name)
-            shutil.rmtree(cache_path)
+
+            if sys.platform == "win32":
+                # Renaming fails on Windows while any file handle is open
+                shutil.rmtree(cache_path)
+            else:
+                # Rename atomically so the model is gone immediately, then delete the files
+                # off the critical path - along with trash left by an interrupted cleanup
+                import glob
+                import uuid
+                trash_path = f"{cache_path}.trash-{uuid.uuid4().hex}"
+                stale_trash = glob.glob(f"{glob.escape(cache_path)}.trash-*")
+                os.rename(cache_path, trash_path)
+                remove_tree_in_background([trash_path, *stale_trash])
+
+            invalidate_model_size(model_name)
 
             # Also remove from model cache
-            if model_name in _model_cache:
-                del _model_cache[model_name]
-                gc.collect()
+            unload_model(model_name)
 
             return {
                 "model": model_name,
@@ -667,54 +1164,274 @@ def delete_model(model_name="base"):
             return {
                 "model": model_name,
                 "deleted": False,
-                "error": "Model not found",
-                "success": False
+                **error_result("Model not found")
             }
     except Exception as e:
         return {
             "model": model_name,
             "deleted": False,
-            "error": str(e),
-            "success": False
+            **error_result(str(e))
         }
 
 
-def transcribe_audio(audio_path, model_name="base", language=None, task="transcribe"):
+def get_short_clip_seconds():
+    """Get the duration below which clips skip VAD and timestamps"""
+    try:
+        return float(os.environ.get("OPENWHISPR_SHORT_CLIP_SECONDS", 10.0))
+    except ValueError:
+        return 10.0
+
+
+def get_wave_cache_bytes():
+    """Get the memory budget for decoded waveforms (OPENWHISPR_WAVE_CACHE_MB, off by default)
+
+    The app writes every dictation to a fresh temp file and deletes it afterwards, so cached
+    waveforms would never be hit again; the cache only pays off for clients that re-transcribe
+    the same files.
+    """
+    try:
+        return max(0, int(float(os.environ.get("OPENWHISPR_WAVE_CACHE_MB", 0)) * 1024 * 1024))
+    except ValueError:
+        return 0
+
+
+def load_audio(audio_source):
+    """Decode audio to 16 kHz float32 samples, reusing the samples of unchanged files if enabled
+
+    Args:
+        audio_source: Path to audio file, a binary file object with encoded audio,
+            or already decoded samples (returned as-is)
+    """
+    global _wave_cache_bytes
+    import numpy as np
+    from faster_whisper.audio import decode_audio
+
+    if isinstance(audio_source, np.ndarray):
+        return audio_source
+    budget = get_wave_cache_bytes()
+    if not budget or not isinstance(audio_source, (str, os.PathLike)):
+        return decode_audio(audio_source, sampling_rate=16000)
+
+    # Re-transcribing the same clip (e.g. after switching models) skips the decode
+    st = os.stat(audio_source)
+    key = (os.path.abspath(audio_source), st.st_mtime_ns, st.st_size)
+    with _wave_cache_lock:
+        audio = _wave_cache.get(key)
+        if audio is not None:
+            _wave_cache.move_to_end(key)
+            return audio
+
+    audio = decode_audio(audio_source, sampling_rate=16000)
+
+    if audio.nbytes <= budget:
+        with _wave_cache_lock:
+            if key not in _wave_cache:
+                _wave_cache[key] = audio
+                _wave_cache_bytes += audio.nbytes
+            while _wave_cache_bytes > budget:
+                _, evicted = _wave_cache.popitem(last=False)
+                _wave_cache_bytes -= evicted.nbytes
+    return audio
+
+
+def audio_file_error(audio_path):
+    """Return why an audio file can't be read, or None if it can
+
+    One open plus fstat on the descriptor replaces a separate existence check.
+    """
+    try:
+        fd = os.open(audio_path, os.O_RDONLY)
+    except FileNotFoundError:
+        return f"Audio file not found: {audio_path}"
+    except OSError as e:
+        return f"Cannot read audio file {audio_path}: {e.strerror}"
+
+    try:
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            return f"Audio path is a directory: {audio_path}"
+    finally:
+        os.close(fd)
+    return None
+
+
+@contextlib.contextmanager
+def attach_shared_audio(shm_name, n_samples, dtype="float32", sample_rate=16000):
+    """Map PCM samples another process placed in shared memory, yielding a float32 array
+
+    float32 samples are used in place without copying; int16 samples are converted.
+    The segment stays owned by its creator: it is closed here but never unlinked, and
+    the yielded array must not be used after the block exits.
+    """
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    if dtype not in ("float32", "int16"):
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    if sample_rate != 16000:
+        raise ValueError(f"Unsupported sample_rate: {sample_rate} (expected 16000)")
+
+    # SharedMemory adds its own leading slash on POSIX
+    name = shm_name.lstrip("/")
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the segment with the resource tracker,
+        # which would unlink the client's segment when this process exits
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix":
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+
+    try:
+        if n_samples * np.dtype(dtype).itemsize > shm.size:
+            raise ValueError(f"n_samples {n_samples} exceeds shared memory segment size {shm.size}")
+        samples = np.ndarray((n_samples,), dtype=dtype, buffer=shm.buf)
+        if dtype == "int16":
+            samples = samples.astype(np.float32) / 32768.0
+        yield samples
+        del samples
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            pass  # A view is still alive; the mapping is released when it is collected
+
+
+def get_max_batch_size():
+    """Get how many queued server requests may be decoded together (OPENWHISPR_MAX_BATCH overrides)"""
+    try:
+        return max(1, int(os.environ["OPENWHISPR_MAX_BATCH"]))
+    except (KeyError, ValueError):
+        # Batching only pays off on GPU; on CPU the clips would just share the same cores
+        return 8 if get_device() == "cuda" else 1
+
+
+def get_batch_wait_seconds():
+    """Get how long a server batch waits for more requests before decoding (OPENWHISPR_BATCH_WAIT_MS)"""
+    try:
+        return max(0.0, float(os.environ.get("OPENWHISPR_BATCH_WAIT_MS", 0))) / 1000
+    except ValueError:
+        return 0.0
+
+
+def transcribe_batch(audios, model_name="base", language=None, task="transcribe", beam_size=1):
+    """Transcribe several short clips in one batched pass, returning one result per clip
+
+    Decodes with transcribe_audio's options for a greedy clip shorter than
+    get_short_clip_seconds() (no VAD, no timestamps, temperature 0), so a clip reads the
+    same whether or not it was batched.
+
+    Args:
+        audios: 16 kHz float32 sample arrays, each shorter than get_short_clip_seconds()
+        model_name: Whisper model name
+        language: Language code shared by every clip (required; detection runs once per batch)
+        task: "transcribe" to keep original language, "translate" to convert to English
+        beam_size: Beam width shared by every clip
+    """
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        # faster-whisper < 1.1 has no batched pipeline; transcribe the clips one by one
+        return [transcribe_audio(audio, model_name, language, task, beam_size) for audio in audios]
+
+    try:
+        import numpy as np
+
+        model = load_model(model_name)
+        if model is None:
+            return [error_result("Failed to load model") for _ in audios]
+
+        # Lay the clips end to end and hand each one to the pipeline as its own chunk,
+        # so the encoder and decoder run once over the whole batch
+        offsets = list(itertools.accumulate((len(audio) for audio in audios[:-1]), initial=0))
+        clips = [{"start": offset / 16000, "end": (offset + len(audio)) / 16000}
+                 for offset, audio in zip(offsets, audios)]
+        starts = [clip["start"] for clip in clips]
+
+        print(f"[whisper_bridge] Transcribing batch of {len(audios)} clips with model={model_name}, "
+              f"task={task}, language={language}, beam_size={beam_size}", file=sys.stderr, flush=True)
+        segments, info = BatchedInferencePipeline(model).transcribe(
+            np.concatenate(audios),
+            language=language,
+            task=task,
+            beam_size=beam_size,
+            best_of=1,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            vad_filter=False,
+            without_timestamps=True,
+            clip_timestamps=clips,
+            batch_size=len(audios),
+        )
+
+        # Segments carry their clip's offset; map each back to the clip it started in
+        text_parts = [[] for _ in audios]
+        for segment in segments:
+            text_parts[max(0, bisect.bisect_right(starts, segment.start + 0.001) - 1)].append(segment.text)
+
+        return [{"text": " ".join(parts).strip(), "language": info.language, "success": True}
+                for parts in text_parts]
+
+    except Exception as e:
+        return [error_result(str(e)) for _ in audios]
+
+
+def transcribe_audio(audio_path, model_name="base", language=None, task="transcribe", beam_size=1,
+                     on_segment=None):
     """Transcribe audio file using Whisper/Distil-Whisper with optimizations
 
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file, a binary file object with encoded audio,
+            or already decoded 16 kHz float32 samples
         model_name: Whisper model name
         language: Language code (e.g., "en", "fr", "es") or None for auto-detect
         task: "transcribe" to keep original language, "translate" to convert to English
+        beam_size: Beam width; 1 (greedy) suits short dictation, 5 suits batch/long-form audio
+        on_segment: Optional callback invoked with each segment as soon as it is decoded
     """
 
-    if not os.path.exists(audio_path):
-        return {"error": f"Audio file not found: {audio_path}", "success": False}
-
     try:
+        # Decode to 16 kHz float32 PCM once; a missing file fails here before any model load
+        audio = load_audio(audio_path)
         # Load model (uses cache for performance)
         model = load_model(model_name)
         if model is None:
-            return {"error": "Failed to load model", "success": False}
+            return error_result("Failed to load model")
 
         # Transcribe with faster-whisper
         options = {
-            "beam_size": 5,
+            "beam_size": beam_size,
             "vad_filter": True,  # Voice activity detection for better results
             "task": task,  # "transcribe" or "translate"
         }
 
+        # Short dictation clips only need the text: skip VAD and timestamp decoding.
+        # OPENWHISPR_SHORT_CLIP_SECONDS tunes the threshold (0 disables the fast path)
+        duration = len(audio) / 16000
+        if duration < get_short_clip_seconds():
+            options["vad_filter"] = False
+            options["without_timestamps"] = True
+
+        if beam_size == 1:
+            # Interactive dictation: one greedy pass with no temperature-fallback re-decodes,
+            # and no conditioning on previous text (prevents hallucination loops)
+            options["best_of"] = 1
+            options["temperature"] = 0.0
+            options["condition_on_previous_text"] = False
+
         if language:
             options["language"] = language
 
-        print(f"[whisper_bridge] Transcribing with model={model_name}, task={task}, language={language}", file=sys.stderr)
-        segments, info = model.transcribe(audio_path, **options)
+        print(f"[whisper_bridge] Transcribing {duration:.1f}s with model={model_name}, task={task}, "
+              f"language={language}, beam_size={beam_size}", file=sys.stderr, flush=True)
+        segments, info = model.transcribe(audio, **options)
 
-        # Collect all text from segments
+        # Collect all text from segments (decoded lazily, one at a time)
         text_parts = []
         for segment in segments:
             text_parts.append(segment.text)
+            if on_segment is not None:
+                on_segment(segment)
 
         text = " ".join(text_parts).strip()
         detected_language = info.language if hasattr(info, 'language') else "unknown"
@@ -726,12 +1443,131 @@ def transcribe_audio(audio_path, model_name="base", language=None, task="transcr
             "success": True
         }
 
+    except FileNotFoundError:
+        return error_result(f"Audio file not found: {audio_path}")
     except Exception as e:
+        return error_result(str(e))
+
+
+def _drop_committed_overlap(committed, words):
+    """Drop words at the head of a new pass that repeat the tail of the committed words"""
+    if not committed or not words or abs(words[0][0] - committed[-1][1]) >= 1:
+        return words
+
+    for n in range(min(5, len(committed), len(words)), 0, -1):
+        if [w.strip() for _, _, w in committed[-n:]] == [w.strip() for _, _, w in words[:n]]:
+            return words[n:]
+    return words
+
+
+def _local_agreement(previous, current):
+    """Return the longest word prefix two successive passes agree on (LocalAgreement-2)"""
+    agreed = []
+    for (_, _, previous_word), word in zip(previous, current):
+        if previous_word.strip() != word[2].strip():
+            break
+        agreed.append(word)
+    return agreed
+
+
+def transcribe_stream(audio_path, model_name="base", language=None, task="transcribe", chunk_ms=1000,
+                      on_partial=None):
+    """Transcribe audio incrementally, confirming words with LocalAgreement-2
+
+    The audio is fed to the model chunk_ms at a time through a rolling buffer of at most
+    30 seconds. A word is confirmed once two successive passes over the growing buffer
+    agree on it, and each newly confirmed run of words is reported through
+    on_partial(text, start, end). Once the buffer passes 15 seconds it is trimmed to the
+    last confirmed sentence end, so a pass only re-decodes audio that is still unconfirmed.
+
+    Args:
+        audio_path: Path to audio file, a binary file object with encoded audio,
+            or already decoded 16 kHz float32 samples
+        model_name: Whisper model name
+        language: Language code (e.g., "en", "fr", "es") or None for auto-detect
+        task: "transcribe" to keep original language, "translate" to convert to English
+        chunk_ms: Audio added to the buffer between passes, in milliseconds
+        on_partial: Optional callback invoked with each newly confirmed text and its time span
+    """
+
+    try:
+        audio = load_audio(audio_path)
+        model = load_model(model_name)
+        if model is None:
+            return error_result("Failed to load model")
+
+        chunk = max(1, int(16000 * chunk_ms / 1000))
+        max_buffer = 30 * 16000
+        committed = []  # Confirmed (start, end, word) tuples in absolute seconds
+        hypothesis = []  # Words from the previous pass that are not confirmed yet
+        buffer_start = 0  # Sample offset of the rolling buffer within the audio
+        detected_language = language
+
+        def report(words):
+            committed.extend(words)
+            if words and on_partial is not None:
+                on_partial("".join(w for _, _, w in words).strip(), words[0][0], words[-1][1])
+
+        print(f"[whisper_bridge] Streaming {len(audio) / 16000:.1f}s in {chunk_ms}ms chunks with "
+              f"model={model_name}, task={task}, language={language}", file=sys.stderr, flush=True)
+        end = 0
+        while end < len(audio):
+            end = min(end + chunk, len(audio))
+            offset = buffer_start / 16000
+
+            # Confirmed text that has scrolled out of the buffer keeps the decoder in context
+            prompt = "".join(w for _, w_end, w in committed if w_end <= offset)[-200:]
+            segments, info = model.transcribe(
+                audio[buffer_start:end],
+                language=detected_language,
+                task=task,
+                beam_size=1,
+                best_of=1,
+                temperature=0.0,
+                condition_on_previous_text=False,
+                vad_filter=False,
+                word_timestamps=True,
+                initial_prompt=prompt or None,
+            )
+            detected_language = language or info.language
+
+            last_time = committed[-1][1] if committed else 0.0
+            words = [(offset + word.start, offset + word.end, word.word)
+                     for segment in segments for word in segment.words or ()
+                     if offset + word.start > last_time - 0.1]
+            words = _drop_committed_overlap(committed, words)
+
+            confirmed = _local_agreement(hypothesis, words)
+            hypothesis = words[len(confirmed):]
+            report(confirmed)
+
+            # Bound reprocessing: cut at the last confirmed sentence end once the buffer is long,
+            # and never let it grow past Whisper's 30 second window
+            if end - buffer_start > max_buffer // 2:
+                sentence_ends = [w_end for _, w_end, w in committed if w.rstrip().endswith((".", "?", "!"))]
+                if sentence_ends:
+                    buffer_start = max(buffer_start, int(sentence_ends[-1] * 16000))
+            if end - buffer_start > max_buffer:
+                trim_to = int(committed[-1][1] * 16000) if committed else 0
+                buffer_start = max(buffer_start, trim_to, end - max_buffer)
+
+        # The last pass has no successor to agree with; accept what it produced
+        report(hypothesis)
+
+        text = "".join(w for _, _, w in committed).strip()
+        print(f"[whisper_bridge] Result: detected_language={detected_language}, text={text[:50]}...", file=sys.stderr)
+
         return {
-            "error": str(e),
-            "success": False
+            "text": text,
+            "language": detected_language or "unknown",
+            "success": True
         }
 
+    except FileNotFoundError:
+        return error_result(f"Audio file not found: {audio_path}")
+    except Exception as e:
+        return error_result(str(e))
+
 
 def check_ffmpeg():
     """Check if FFmpeg is available and working"""
@@ -753,206 +1589,669 @@ def check_ffmpeg():
         else:
             return {
                 "available": False,
-                "error": f"FFmpeg returned code {result.returncode}: {result.stderr}",
-                "success": False
+                **error_result(f"FFmpeg returned code {result.returncode}: {result.stderr}")
             }
     except subprocess.TimeoutExpired:
         return {
             "available": False,
-            "error": "FFmpeg check timed out",
-            "success": False
+            **error_result("FFmpeg check timed out")
         }
     except FileNotFoundError:
         return {
             "available": False,
-            "error": "FFmpeg not found in PATH",
-            "success": False
+            **error_result("FFmpeg not found in PATH")
         }
     except Exception as e:
         return {
             "available": False,
-            "error": str(e),
-            "success": False
+            **error_result(str(e))
         }
 
 
-def run_server(model_name="base"):
+def disable_autograd():
+    """Turn off gradient tracking on the calling thread if PyTorch is already loaded
+
+    CTranslate2 runs inference without autograd, so this only matters for PyTorch code
+    that ends up on the worker thread. PyTorch is never imported just for this, and
+    its grad mode is per thread, so the worker thread calls this itself.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_grad_enabled(False)
+
+
+def emit_message(message):
+    """Write one message to stdout as a JSON line or msgpack frame; safe to call from any server thread"""
+    if _msgpack_stdout is not None:
+        body = msgpack.packb(message, use_bin_type=True)
+        frame = _FRAME_HEADER.pack(len(body)) + body
+        with _stdout_lock:
+            _msgpack_stdout.write(frame)
+            _msgpack_stdout.flush()
+        return
+
+    line = json_dumpb(message) + b"\n"
+    with _stdout_lock:
+        sys.stdout.buffer.write(line)
+        sys.stdout.buffer.flush()
+
+
+def write_json(obj):
+    """Write one JSON document to stdout as a line of bytes, skipping the text layer"""
+    sys.stdout.buffer.write(json_dumpb(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _emit_error(message, *, fatal=False):
+    """Write a failed result to stdout as one JSON line, exiting with status 1 if fatal"""
+    write_json(error_result(message))
+    if fatal:
+        sys.exit(1)
+
+
+def _read_blocking(fd, size):
+    """Yield blocking reads from fd until EOF"""
+    while True:
+        chunk = os.read(fd, size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_stdin_chunks(size=65536):
+    """Yield raw bytes from stdin as they arrive, ending at EOF
+
+    On POSIX stdin is made non-blocking and polled with a selector, so each wakeup
+    drains everything the client has written so far in one read.
+    """
+    fd = sys.stdin.fileno()
+    if os.name != "posix":
+        # Windows pipes can't be made non-blocking; a blocking read still returns what is available
+        yield from _read_blocking(fd, size)
+        return
+
+    with selectors.DefaultSelector() as selector:
+        try:
+            selector.register(fd, selectors.EVENT_READ)
+        except OSError:
+            # epoll rejects regular files and /dev/null, which never block anyway
+            yield from _read_blocking(fd, size)
+            return
+
+        was_blocking = os.get_blocking(fd)
+        os.set_blocking(fd, False)
+        try:
+            while True:
+                selector.select()
+                try:
+                    chunk = os.read(fd, size)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            # stdin may be a terminal shared with the parent shell
+            os.set_blocking(fd, was_blocking)
+
+
+def iter_json_lines(chunks):
+    """Split a byte stream into its non-empty lines, one JSON request each"""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if b"\n" not in chunk:
+            continue
+
+        *lines, tail = buffer.split(b"\n")
+        buffer = tail
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line
+
+    # A last request without a trailing newline
+    buffer = buffer.strip()
+    if buffer:
+        yield buffer
+
+
+def iter_msgpack_frames(chunks):
+    """Split a byte stream into the bodies of its length-prefixed msgpack frames"""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= _FRAME_HEADER.size:
+            (length,) = _FRAME_HEADER.unpack_from(buffer)
+            end = _FRAME_HEADER.size + length
+            if len(buffer) < end:
+                break
+            yield bytes(buffer[_FRAME_HEADER.size:end])
+            del buffer[:end]
+
+
+def unpack_msgpack(body):
+    return msgpack.unpackb(body, raw=False)
+
+
+def run_server(model_name="base", proto="json"):
     """Run as a persistent server that keeps the model loaded in GPU memory.
 
-    Communicates via JSON over stdin/stdout:
+    Communicates via JSON lines over stdin/stdout, or with proto="msgpack" via msgpack
+    messages each prefixed by a little-endian uint32 byte length. Messages are the same:
     - Input: {"command": "transcribe", "audio_path": "/path/to/audio", "language": "auto"}
+    - Input: {"command": "transcribe", "audio_bytes_b64": "<base64 encoded audio>"} - skips the disk
+    - Input: {"command": "transcribe", "shm_name": "/owspr_123", "n_samples": N, "dtype": "float32",
+      "sample_rate": 16000} - 16 kHz mono PCM read in place from a shared memory segment
+    - Input: optional "beam_size" on transcribe requests (default 1, greedy)
+    - Input: optional "stream": true on transcribe requests - emits
+      {"type": "partial", "text": ..., "start": ..., "end": ...} per decoded segment,
+      then the usual result with "type": "final"
+    - Input: {"command": "transcribe_stream", "audio_path": ..., "chunk_ms": 1000} - re-decodes
+      a growing buffer every chunk_ms and emits {"type": "partial", ...} for words confirmed by
+      two successive passes, then the result with "type": "final"
+    - Input: {"command": "reload", "model": "small", "precision": "int8"} - switch model and/or
+      weight precision ("auto", "fp16", "bf16" or "int8")
     - Input: {"command": "ping"} - health check
     - Input: {"command": "shutdown"} - graceful shutdown
-    - Output: {"success": true, "text": "transcribed text", ...}
+    - Output: {"success": true, "text": "transcribed text", "request_id": 1, ...}
+
+    The main thread reads and parses stdin while a single worker thread runs the
+    commands, so the next request is already parsed when the model frees up.
+    Every reply echoes the request's "request_id" (or a server-assigned counter).
+    On GPU, transcribe requests that queue up behind a busy worker are decoded as one
+    batch (OPENWHISPR_MAX_BATCH caps its size, OPENWHISPR_BATCH_WAIT_MS lets it wait).
+    Replies within a batch go out group by group, so clients that pipeline transcribe
+    requests must match replies by "request_id" rather than rely on arrival order.
     """
+    global _msgpack_stdout
+
+    # Buffer log lines and write them out once per reply instead of once per print;
+    # anything still buffered is written at exit. Lines logged right before native decoding
+    # or model loads, and from other threads, are flushed as they are written, and a native
+    # crash dumps the Python stacks straight to the stderr descriptor
+    faulthandler.enable()
+    sys.stderr.flush()
+    sys.stderr = io.TextIOWrapper(
+        io.BufferedWriter(io.FileIO(sys.stderr.fileno(), "wb", closefd=False), 8192),
+        encoding=sys.stderr.encoding,
+        errors="backslashreplace",
+        write_through=False,
+    )
+    atexit.register(sys.stderr.flush)
+
     print(f"[whisper_bridge] Starting server mode with model '{model_name}'", file=sys.stderr)
 
-    # Preload model into GPU memory
-    model = load_model(model_name)
-    if model is None:
-        error_result = {"error": "Failed to load model", "success": False}
-        print(json.dumps(error_result), flush=True)
-        sys.exit(1)
+    if proto == "msgpack":
+        if msgpack is None:
+            _emit_error("msgpack protocol requested but msgpack is not installed", fatal=True)
+        sys.stdout.flush()
+        _msgpack_stdout = io.BufferedWriter(io.FileIO(sys.stdout.fileno(), "wb", closefd=False), 65536)
+        iter_messages = iter_msgpack_frames
+        decode_request = unpack_msgpack
+        invalid_request = "Invalid msgpack"
+    else:
+        iter_messages = iter_json_lines
+        decode_request = json_loads
+        invalid_request = "Invalid JSON"
+
+    preload_done = None
+    if os.environ.get("OPENWHISPR_PRELOAD") == "1":
+        # Report ready immediately and overlap the model load with the client handshake;
+        # the first transcribe waits for the background load to finish
+        preload_done = start_model_preload(model_name)
+        model = None
+        print(f"[whisper_bridge] Model '{model_name}' loading in background", file=sys.stderr)
+    else:
+        # Preload model into GPU memory
+        model = load_model(model_name, warmup=True)
+        if model is None:
+            emit_message(error_result("Failed to load model"))
+            sys.exit(1)
 
-    print(f"[whisper_bridge] Model '{model_name}' loaded and ready", file=sys.stderr)
-    print(json.dumps({"type": "ready", "model": model_name, "success": True}), flush=True)
+        print(f"[whisper_bridge] Model '{model_name}' loaded and ready", file=sys.stderr)
+    sys.stderr.flush()
+    emit_message({"type": "ready", "model": model_name, "success": True})
 
-    # Server loop - read commands from stdin
-    while True:
-        try:
-            line = sys.stdin.readline()
-            if not line:
-                # EOF - stdin closed
-                print("[whisper_bridge] Server stdin closed, shutting down", file=sys.stderr)
-                break
+    emit = emit_message  # Local aliases for the per-reply hot path
+    log = sys.stderr
 
-            line = line.strip()
-            if not line:
-                continue
+    def reply(message, request_id):
+        message["request_id"] = request_id
+        log.flush()  # Logs leading up to a reply go out with it in one write
+        emit(message)
+
+    def reply_error(message, request_id):
+        reply(error_result(message), request_id)
 
+    def prepare_transcribe(request, request_id, cleanup):
+        """Validate a transcribe request, replying with an error and returning None if it is invalid
+
+        Shared-memory audio is attached on the `cleanup` ExitStack and detached when it closes.
+        """
+        audio_path = request.get("audio_path")
+        audio_bytes_b64 = request.get("audio_bytes_b64")
+        shm_name = request.get("shm_name")
+        language = request.get("language")
+        task = request.get("task", "transcribe")  # "transcribe" or "translate"
+        print(f"[whisper_bridge] Server received: task={task}, language={language}", file=sys.stderr)
+
+        try:
+            beam_size = max(1, int(request.get("beam_size", 1)))
+        except (TypeError, ValueError):
+            reply_error(f"Invalid beam_size: {request.get('beam_size')}", request_id)
+            return None
+
+        if shm_name:
+            # Raw PCM already in memory on the client side - use it in place
+            if "n_samples" not in request:
+                reply_error("Missing n_samples", request_id)
+                return None
             try:
-                request = json.loads(line)
-            except json.JSONDecodeError as e:
-                error_result = {"error": f"Invalid JSON: {e}", "success": False}
-                print(json.dumps(error_result), flush=True)
-                continue
+                audio_source = cleanup.enter_context(attach_shared_audio(
+                    shm_name,
+                    int(request["n_samples"]),
+                    request.get("dtype", "float32"),
+                    int(request.get("sample_rate", 16000)),
+                ))
+            except (TypeError, ValueError, OSError) as e:
+                reply_error(f"Invalid shared memory audio: {e}", request_id)
+                return None
+        elif audio_bytes_b64:
+            # Encoded audio sent inline - decode from memory without touching disk
+            try:
+                audio_source = io.BytesIO(base64.b64decode(audio_bytes_b64, validate=True))
+            except ValueError as e:
+                reply_error(f"Invalid audio_bytes_b64: {e}", request_id)
+                return None
+        elif not audio_path:
+            reply_error("Missing audio_path", request_id)
+            return None
+        else:
+            error = audio_file_error(audio_path)
+            if error:
+                reply_error(error, request_id)
+                return None
+            audio_source = audio_path
 
-            command = request.get("command", "transcribe")
+        return audio_source, language, task, beam_size
 
-            if command == "ping":
-                # Health check
-                print(json.dumps({"type": "pong", "success": True}), flush=True)
+    def handle_request(request, request_id, cleanup):
+        """Run one command on the worker thread"""
+        nonlocal model, model_name, preload_done
 
-            elif command == "shutdown":
-                print("[whisper_bridge] Received shutdown command", file=sys.stderr)
-                print(json.dumps({"type": "shutdown", "success": True}), flush=True)
-                break
+        command = request.get("command", "transcribe")
 
-            elif command == "transcribe":
-                audio_path = request.get("audio_path")
-                language = request.get("language")
-                task = request.get("task", "transcribe")  # "transcribe" or "translate"
-                print(f"[whisper_bridge] Server received: task={task}, language={language}", file=sys.stderr)
+        if command == "ping":
+            # Health check
+            reply({"type": "pong", "success": True}, request_id)
 
-                if not audio_path:
-                    error_result = {"error": "Missing audio_path", "success": False}
-                    print(json.dumps(error_result), flush=True)
-                    continue
+        elif command == "transcribe":
+            prepared = prepare_transcribe(request, request_id, cleanup)
+            if prepared is None:
+                return
+            audio_source, language, task, beam_size = prepared
 
-                if not os.path.exists(audio_path):
-                    error_result = {"error": f"Audio file not found: {audio_path}", "success": False}
-                    print(json.dumps(error_result), flush=True)
-                    continue
+            if preload_done is not None:
+                preload_done.wait()
+                preload_done = None
 
-                # Transcribe using the preloaded model
-                result = transcribe_audio(audio_path, model_name, language, task)
-                print(json.dumps(result), flush=True)
+            def on_segment(segment):
+                reply({"type": "partial", "text": segment.text, "start": segment.start, "end": segment.end},
+                      request_id)
 
-            elif command == "reload":
-                # Reload model (e.g., if user changed model selection)
-                new_model = request.get("model", model_name)
-                if new_model == model_name:
-                    print(json.dumps({"type": "reloaded", "model": model_name, "success": True}), flush=True)
-                    continue
+            callback = on_segment if request.get("stream") else None
+
+            # Transcribe using the preloaded model
+            result = transcribe_audio(audio_source, model_name, language, task, beam_size, callback)
+            if callback is not None:
+                result["type"] = "final"
+            reply(result, request_id)
+
+        elif command == "transcribe_stream":
+            prepared = prepare_transcribe(request, request_id, cleanup)
+            if prepared is None:
+                return
+            audio_source, language, task, _ = prepared
 
-                print(f"[whisper_bridge] Unloading model '{model_name}' to free GPU memory", file=sys.stderr)
-                # Explicitly unload previous model to free GPU memory
-                if model_name in _model_cache:
-                    del _model_cache[model_name]
-                del model
-                gc.collect()
-                # Force CUDA memory cleanup if available
+            try:
+                chunk_ms = max(100, int(request.get("chunk_ms", 1000)))
+            except (TypeError, ValueError):
+                reply_error(f"Invalid chunk_ms: {request.get('chunk_ms')}", request_id)
+                return
+
+            if preload_done is not None:
+                preload_done.wait()
+                preload_done = None
+
+            def on_partial(text, start, end):
+                reply({"type": "partial", "text": text, "start": start, "end": end}, request_id)
+
+            result = transcribe_stream(audio_source, model_name, language, task, chunk_ms, on_partial)
+            result["type"] = "final"
+            reply(result, request_id)
+
+        elif command == "reload":
+            # Reload model (e.g., if user changed model or precision selection)
+            new_model = request.get("model", model_name)
+            previous_precision, previous_compute_type = _precision, get_compute_type()
+            if "precision" in request:
                 try:
-                    import torch
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                        print("[whisper_bridge] GPU memory cleared", file=sys.stderr)
-                except ImportError:
-                    pass
-
-                print(f"[whisper_bridge] Loading new model '{new_model}'", file=sys.stderr)
-                model = load_model(new_model)
-                if model is None:
-                    error_result = {"error": f"Failed to load model '{new_model}'", "success": False}
-                    print(json.dumps(error_result), flush=True)
-                else:
-                    model_name = new_model
-                    print(json.dumps({"type": "reloaded", "model": model_name, "success": True}), flush=True)
+                    set_precision(request["precision"])
+                except ValueError as e:
+                    reply_error(str(e), request_id)
+                    return
+            # The same model at another precision is a different cache entry
+            precision_changed = get_compute_type() != previous_compute_type
+
+            if new_model == model_name and not precision_changed:
+                reply({"type": "reloaded", "model": model_name, "success": True}, request_id)
+                return
+
+            cached = get_cached_model(new_model)
+            if cached is not None:
+                # Still warm in the LRU cache - switching back is just a reference swap
+                model, model_name = cached, new_model
+                print(f"[whisper_bridge] Switched to cached model '{model_name}'", file=sys.stderr)
+                reply({"type": "reloaded", "model": model_name, "success": True}, request_id)
+                return
+
+            # When free VRAM shows room for both, load the new model next to the old one,
+            # acknowledge, and leave any eviction to a background thread. Otherwise, and always
+            # on CPU where host memory isn't measured, evict first so the cache never overflows.
+            # The previous model stays in the LRU cache unless room is needed for the new one
+            load_first = get_device() == "cuda" and can_load_alongside(new_model)
+            if not load_first:
+                # Drop our reference first so an evicted model can actually be freed
+                model = None
+                make_room_for_model(new_model)
+
+            print(f"[whisper_bridge] Switching to model '{new_model}'", file=sys.stderr)
+            new_instance = load_model(new_model, warmup=True, evict=not load_first)
+            if new_instance is None:
+                # Stay on the previous model and the precision it was loaded with
+                set_precision(previous_precision)
+                reply_error(f"Failed to load model '{new_model}'", request_id)
+                return
+
+            model, model_name = new_instance, new_model
+            reply({"type": "reloaded", "model": model_name, "success": True}, request_id)
+            if load_first:
+                threading.Thread(target=evict_lru_models, name="whisper-evict", daemon=True).start()
+
+        else:
+            reply_error(f"Unknown command: {command}", request_id)
 
+    def run_request(request, request_id):
+        try:
+            # Shared-memory audio is detached once the handler's references to it are gone
+            with contextlib.ExitStack() as cleanup:
+                handle_request(request, request_id, cleanup)
+        except Exception as e:
+            reply_error(f"Server error: {e}", request_id)
+
+    def handle_batch(batch, cleanup):
+        """Transcribe queued requests, decoding short clips with the same settings together"""
+        nonlocal preload_done
+
+        if preload_done is not None:
+            preload_done.wait()
+            preload_done = None
+
+        # Only greedy short clips with an explicit language share a batch: transcribe_audio
+        # decodes those with the fixed options transcribe_batch uses, while longer clips get
+        # VAD and wider beams get temperature fallback, which the batched pipeline lacks
+        short_clip_seconds = get_short_clip_seconds()
+        groups = {}
+        for request, request_id in batch:
+            prepared = prepare_transcribe(request, request_id, cleanup)
+            if prepared is None:
+                continue
+            audio_source, language, task, beam_size = prepared
+            try:
+                audio = load_audio(audio_source)
+            except FileNotFoundError:
+                reply_error(f"Audio file not found: {audio_source}", request_id)
+                continue
+            except Exception as e:
+                reply_error(str(e), request_id)
+                continue
+
+            duration = len(audio) / 16000
+            if language and beam_size == 1 and duration < short_clip_seconds:
+                key = (language, task)
             else:
-                error_result = {"error": f"Unknown command: {command}", "success": False}
-                print(json.dumps(error_result), flush=True)
+                key = request_id
+            groups.setdefault(key, []).append((request_id, audio, language, task, beam_size))
 
-        except KeyboardInterrupt:
-            print("[whisper_bridge] Server interrupted", file=sys.stderr)
-            break
+        for items in groups.values():
+            if len(items) == 1:
+                request_id, audio, language, task, beam_size = items[0]
+                reply(transcribe_audio(audio, model_name, language, task, beam_size), request_id)
+                continue
+
+            _, _, language, task, beam_size = items[0]
+            results = transcribe_batch([audio for _, audio, _, _, _ in items], model_name,
+                                       language, task, beam_size)
+            for (request_id, _, _, _, _), result in zip(items, results):
+                reply(result, request_id)
+
+    def run_batch(batch):
+        nonlocal open_batch
+        with batch_ready:
+            # Give a lone request a moment to gain company, then stop accepting new ones
+            batch_ready.wait_for(lambda: len(batch) >= max_batch, timeout=batch_wait)
+            if open_batch is batch:
+                open_batch = None
+
+        if len(batch) == 1:
+            run_request(*batch[0])
+            return
+        try:
+            with contextlib.ExitStack() as cleanup:
+                handle_batch(batch, cleanup)
         except Exception as e:
-            error_result = {"error": f"Server error: {e}", "success": False}
-            print(json.dumps(error_result), flush=True)
+            for _, request_id in batch:
+                reply_error(f"Server error: {e}", request_id)
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-worker",
+                                  initializer=disable_autograd)
+    request_counter = itertools.count(1)
+
+    # Transcribe requests that arrive while the worker is busy join the batch that is still
+    # waiting in the executor; any other command closes it so requests never overtake it
+    max_batch = get_max_batch_size()
+    batch_wait = get_batch_wait_seconds()
+    batch_ready = threading.Condition()
+    open_batch = None
+
+    def queue_error(message, request_id):
+        """Reply with an error from the worker, after the replies to earlier requests"""
+        nonlocal open_batch
+        with batch_ready:
+            open_batch = None
+        executor.submit(reply_error, message, request_id)
+
+    # Server loop - read commands from stdin and queue them for the worker
+    try:
+        for message in iter_messages(read_stdin_chunks()):
+            try:
+                request = decode_request(message)
+            except ValueError as e:
+                # Covers json.JSONDecodeError and msgpack's unpacking errors
+                queue_error(f"{invalid_request}: {str(e) or type(e).__name__}", next(request_counter))
+                continue
+
+            request_id = next(request_counter)
+            if not isinstance(request, dict):
+                queue_error("Invalid request: expected an object", request_id)
+                continue
+
+            request_id = request.get("request_id", request_id)
+
+            if request.get("command") == "shutdown":
+                print("[whisper_bridge] Received shutdown command", file=sys.stderr, flush=True)
+                # Let queued requests finish before acknowledging
+                executor.shutdown(wait=True)
+                reply({"type": "shutdown", "success": True}, request_id)
+                break
+
+            if max_batch > 1 and request.get("command", "transcribe") == "transcribe" and not request.get("stream"):
+                with batch_ready:
+                    if open_batch is not None and len(open_batch) < max_batch:
+                        open_batch.append((request, request_id))
+                        batch_ready.notify()
+                        continue
+                    open_batch = batch = [(request, request_id)]
+                executor.submit(run_batch, batch)
+                continue
+
+            with batch_ready:
+                open_batch = None
+            executor.submit(run_request, request, request_id)
+        else:
+            # EOF - stdin closed
+            print("[whisper_bridge] Server stdin closed, shutting down", file=sys.stderr, flush=True)
+
+    except KeyboardInterrupt:
+        print("[whisper_bridge] Server interrupted", file=sys.stderr, flush=True)
+    finally:
+        executor.shutdown(wait=True)
 
     print("[whisper_bridge] Server shutdown complete", file=sys.stderr)
 
 
-def main():
+# Command line flags with their defaults and allowed values, shared by argparse and parse_args_fast
+CLI_DEFAULTS = {
+    "mode": "transcribe",
+    "audio_file": None,
+    "model": "base",
+    "language": None,
+    "task": "transcribe",
+    "beam_size": 1,
+    "output_format": "json",
+    "proto": "json",
+    "precision": "auto",
+}
+CLI_CHOICES = {
+    "mode": ["transcribe", "download", "check", "list", "delete", "check-ffmpeg", "server"],
+    "task": ["transcribe", "translate"],
+    "output_format": ["json", "text"],
+    "proto": ["json", "msgpack"],
+    "precision": PRECISION_CHOICES,
+}
+
+
+def parse_args_fast(argv):
+    """Parse the plain "--flag value [audio_file]" command lines the app sends without argparse
+
+    Returns None for anything else (help, --flag=value, unknown flags or invalid values)
+    so that argparse handles it and reports errors as usual.
+    """
+    values = dict(CLI_DEFAULTS)
+    args = iter(argv)
+    for arg in args:
+        if not arg.startswith("-"):
+            if values["audio_file"] is not None:
+                return None
+            values["audio_file"] = arg
+            continue
+
+        key = arg[2:].replace("-", "_")
+        value = next(args, None)
+        if not arg.startswith("--") or key not in CLI_DEFAULTS or key == "audio_file" \
+                or value is None or value.startswith("-"):
+            return None
+        values[key] = value
+
+    if any(values[key] not in choices for key, choices in CLI_CHOICES.items()):
+        return None
+    try:
+        values["beam_size"] = int(values["beam_size"])
+    except ValueError:
+        return None
+    return SimpleNamespace(**values)
+
+
+def parse_args():
+    """Parse the command line, skipping argparse for the common app invocations"""
+    args = parse_args_fast(sys.argv[1:])
+    if args is not None:
+        return args
+
+    import argparse
     parser = argparse.ArgumentParser(description="Whisper Bridge for OpenWhispr")
-    parser.add_argument("--mode", default="transcribe",
-                       choices=["transcribe", "download", "check", "list", "delete", "check-ffmpeg", "server"],
+    parser.add_argument("--mode", default=CLI_DEFAULTS["mode"],
+                       choices=CLI_CHOICES["mode"],
                        help="Operation mode (default: transcribe)")
     parser.add_argument("audio_file", nargs="?", help="Path to audio file to transcribe")
-    parser.add_argument("--model", default="base",
+    parser.add_argument("--model", default=CLI_DEFAULTS["model"],
                        help="Whisper model to use (default: base)")
     parser.add_argument("--language", help="Language code (optional)")
-    parser.add_argument("--task", default="transcribe",
-                       choices=["transcribe", "translate"],
+    parser.add_argument("--task", default=CLI_DEFAULTS["task"],
+                       choices=CLI_CHOICES["task"],
                        help="Task: 'transcribe' keeps original language, 'translate' converts to English (default: transcribe)")
-    parser.add_argument("--output-format", default="json",
-                       choices=["json", "text"],
+    parser.add_argument("--beam-size", type=int, default=CLI_DEFAULTS["beam_size"],
+                       help="Beam width: 1 (greedy) for dictation, 5 for long-form audio (default: 1)")
+    parser.add_argument("--output-format", default=CLI_DEFAULTS["output_format"],
+                       choices=CLI_CHOICES["output_format"],
                        help="Output format (default: json)")
+    parser.add_argument("--proto", default=CLI_DEFAULTS["proto"],
+                       choices=CLI_CHOICES["proto"],
+                       help="Server protocol: JSON lines or length-prefixed msgpack (default: json)")
+    parser.add_argument("--precision", default=CLI_DEFAULTS["precision"],
+                       choices=CLI_CHOICES["precision"],
+                       help="Weight precision: fp16, bf16 or int8 (int8_float16 on GPU); auto picks per device (default: auto)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    set_precision(args.precision)
 
-    args = parser.parse_args()
+    # Only modes that load a model need the CUDA libraries, and they must load before CTranslate2
+    if args.mode in ("transcribe", "server", "download"):
+        check_cudnn_available()
 
     # Handle different modes
     if args.mode == "server":
-        run_server(args.model)
+        run_server(args.model, args.proto)
         return
     elif args.mode == "download":
         result = download_model(args.model)
-        print(json.dumps(result))
+        write_json(result)
         return
     elif args.mode == "check":
         result = check_model_status(args.model)
-        print(json.dumps(result))
+        write_json(result)
         return
     elif args.mode == "list":
         result = list_models()
-        print(json.dumps(result))
+        write_json(result)
         return
     elif args.mode == "delete":
         result = delete_model(args.model)
-        print(json.dumps(result))
+        write_json(result)
         return
     elif args.mode == "check-ffmpeg":
         result = check_ffmpeg()
-        print(json.dumps(result))
+        write_json(result)
         return
     elif args.mode == "transcribe":
         # Check if audio file exists
         if not args.audio_file:
-            error_result = {"error": "Audio file required for transcription mode", "success": False}
-            print(json.dumps(error_result))
-            sys.exit(1)
+            _emit_error("Audio file required for transcription mode", fatal=True)
 
-        if not os.path.exists(args.audio_file):
-            error_result = {"error": f"Audio file not found: {args.audio_file}", "success": False}
-            print(json.dumps(error_result))
-            sys.exit(1)
+        error = audio_file_error(args.audio_file)
+        if error:
+            _emit_error(error, fatal=True)
 
         # Transcribe
-        result = transcribe_audio(args.audio_file, args.model, args.language, args.task)
+        result = transcribe_audio(args.audio_file, args.model, args.language, args.task, args.beam_size)
 
         # Output results
         if args.output_format == "json":
-            print(json.dumps(result))
+            write_json(result)
         else:
             if result.get("success"):
                 print(result.get("text", ""))